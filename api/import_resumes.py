@@ -0,0 +1,368 @@
+import os
+import sys
+import io
+import json
+import time
+import queue
+import hashlib
+import sqlite3
+import zipfile
+import argparse
+import traceback
+from multiprocessing import Pool
+
+# Support both `python -m api.import_resumes` and `cd api && python import_resumes.py`
+try:
+    from api.routes.resume import extract_text_from_pdf, analyze_with_local_logic
+except ImportError:
+    from routes.resume import extract_text_from_pdf, analyze_with_local_logic
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS imported_resume (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    path TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    text_length INTEGER NOT NULL,
+    overall_score INTEGER,
+    skills_match INTEGER,
+    experience_relevance INTEGER,
+    ats_compatibility INTEGER,
+    keyword_density INTEGER,
+    analysis TEXT NOT NULL,
+    elapsed_ms INTEGER NOT NULL,
+    imported_at REAL NOT NULL,
+    UNIQUE (source, path, job_title, job_hash)
+);
+CREATE TABLE IF NOT EXISTS import_failure (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    path TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    error_type TEXT NOT NULL,
+    error TEXT NOT NULL,
+    details TEXT,
+    failed_at REAL NOT NULL,
+    UNIQUE (source, path, job_title, job_hash)
+);
+"""
+
+# Workers are recycled after this many files so PyPDF2 memory growth does not accumulate
+MAX_TASKS_PER_CHILD = 200
+
+# Zip archive handle cached per worker process so members are not re-opened per file
+_worker_archive = None
+_worker_job = None
+
+def init_worker(archive_path, job_title, job_description):
+    """Open shared resources once per worker process"""
+    global _worker_archive, _worker_job
+    _worker_archive = zipfile.ZipFile(archive_path) if archive_path else None
+    _worker_job = (job_title, job_description)
+
+def process_file(task):
+    """Extract and analyze a single resume; runs inside a worker process"""
+    root, rel_path = task
+    started = time.perf_counter()
+    try:
+        if _worker_archive is not None:
+            pdf_file = io.BytesIO(_worker_archive.read(rel_path))
+        else:
+            pdf_file = os.path.join(root, rel_path)
+
+        resume_text = extract_text_from_pdf(pdf_file)
+        if not resume_text.strip():
+            raise ValueError("No readable text extracted from PDF")
+
+        job_title, job_description = _worker_job
+        analysis = analyze_with_local_logic(resume_text, job_title, job_description)
+        return {
+            'path': rel_path,
+            'ok': True,
+            'text_length': len(resume_text),
+            'analysis': analysis,
+            'elapsed_ms': int((time.perf_counter() - started) * 1000)
+        }
+    except Exception as e:
+        # extract_text_from_pdf wraps parser errors in a plain Exception; report the original type
+        original = e.__cause__ or e.__context__ or e
+        return {
+            'path': rel_path,
+            'ok': False,
+            'error_type': type(original).__name__,
+            'error': str(e),
+            'details': traceback.format_exc(limit=3)
+        }
+
+def worker_failure(path, error_type, error, details=None):
+    """Build a failure result for a file whose worker never returned one"""
+    return {
+        'path': path,
+        'ok': False,
+        'error_type': error_type,
+        'error': error,
+        'details': details
+    }
+
+def list_pdfs(source):
+    """Return (archive_path, root, relative PDF paths) for a directory or zip archive"""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [
+                info.filename for info in archive.infolist()
+                if not info.is_dir() and info.filename.lower().endswith('.pdf')
+            ]
+        return source, source, sorted(names)
+
+    if not os.path.isdir(source):
+        raise ValueError(f"Source must be a directory or zip archive: {source}")
+
+    names = []
+    for dirpath, _, filenames in os.walk(source):
+        for filename in filenames:
+            if filename.lower().endswith('.pdf'):
+                names.append(os.path.relpath(os.path.join(dirpath, filename), source))
+    return None, source, sorted(names)
+
+def open_database(db_path):
+    """Open the import database and make sure the schema exists"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def job_key(job_title, job_description):
+    """Identify the job a resume was analyzed against; scores only mean something per job"""
+    return job_title, hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+
+def load_checkpoint(conn, source, job, retry_failed=False):
+    """Paths already recorded for this source and job; these are skipped on resume"""
+    params = (source,) + job
+    done = {row[0] for row in conn.execute(
+        "SELECT path FROM imported_resume WHERE source = ? AND job_title = ? AND job_hash = ?",
+        params)}
+    if retry_failed:
+        conn.execute(
+            "DELETE FROM import_failure WHERE source = ? AND job_title = ? AND job_hash = ?",
+            params)
+        conn.commit()
+    else:
+        done.update(row[0] for row in conn.execute(
+            "SELECT path FROM import_failure WHERE source = ? AND job_title = ? AND job_hash = ?",
+            params))
+    return done
+
+def write_batch(conn, source, job, results):
+    """Persist one batch of results in a single transaction"""
+    now = time.time()
+    successes = []
+    failures = []
+    for result in results:
+        if result['ok']:
+            analysis = result['analysis']
+            successes.append((
+                source, result['path'], *job, result['text_length'],
+                analysis.get('overall_score'), analysis.get('skills_match'),
+                analysis.get('experience_relevance'), analysis.get('ats_compatibility'),
+                analysis.get('keyword_density'), json.dumps(analysis),
+                result['elapsed_ms'], now
+            ))
+        else:
+            failures.append((
+                source, result['path'], *job, result['error_type'],
+                result['error'], result['details'], now
+            ))
+
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO imported_resume (source, path, job_title, job_hash, text_length, "
+            "overall_score, skills_match, experience_relevance, ats_compatibility, keyword_density, "
+            "analysis, elapsed_ms, imported_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            successes
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO import_failure (source, path, job_title, job_hash, error_type, "
+            "error, details, failed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            failures
+        )
+
+def run_import(source, db_path, job_title, job_description, workers=None,
+               batch_size=200, retry_failed=False, file_timeout=60, out=sys.stdout):
+    """Import every PDF under `source` into `db_path`, resuming from prior runs"""
+    source = os.path.abspath(source)
+    archive_path, root, paths = list_pdfs(source)
+
+    job = job_key(job_title, job_description)
+    conn = open_database(db_path)
+    done = load_checkpoint(conn, source, job, retry_failed=retry_failed)
+    pending = [path for path in paths if path not in done]
+
+    print(f"Found {len(paths)} PDFs in {source}; {len(paths) - len(pending)} already "
+          f"processed, {len(pending)} to process", file=out)
+
+    stats = {'processed': 0, 'imported': 0, 'failed': 0, 'elapsed': 0.0}
+    if not pending:
+        conn.close()
+        return stats
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    remaining = iter(pending)
+    batch = []
+    started = time.perf_counter()
+
+    # Results arrive through pool callbacks; each submission gets a token so results from a
+    # recycled pool are ignored. One file in flight per worker keeps submit time ~ start time.
+    results = queue.Queue()
+    in_flight = {}
+    tokens = iter(range(sys.maxsize))
+
+    def start_pool():
+        return Pool(workers, initializer=init_worker,
+                    initargs=(archive_path, job_title, job_description),
+                    maxtasksperchild=MAX_TASKS_PER_CHILD)
+
+    def submit(path):
+        token = next(tokens)
+        in_flight[path] = (token, time.monotonic())
+        pool.apply_async(
+            process_file, ((root, path),),
+            callback=lambda result: results.put((token, result)),
+            error_callback=lambda e: results.put((token, worker_failure(
+                path, type(e).__name__, str(e))))
+        )
+
+    def flush():
+        # Take the batch before writing so a failed write is not retried during cleanup
+        pending_results = list(batch)
+        batch.clear()
+        write_batch(conn, source, job, pending_results)
+        elapsed = time.perf_counter() - started
+        rate = stats['processed'] / elapsed if elapsed else 0.0
+        print(f"[{stats['processed']}/{len(pending)}] {rate:.1f} files/sec, "
+              f"{stats['failed']} failed", file=out)
+
+    def record(result):
+        stats['processed'] += 1
+        if result['ok']:
+            stats['imported'] += 1
+        else:
+            stats['failed'] += 1
+            print(f"FAILED {result['path']}: {result['error_type']}: {result['error']}",
+                  file=out)
+        batch.append(result)
+        if len(batch) >= batch_size:
+            flush()
+
+    pool = start_pool()
+    try:
+        while True:
+            while len(in_flight) < workers:
+                path = next(remaining, None)
+                if path is None:
+                    break
+                submit(path)
+            if not in_flight:
+                break
+
+            oldest = min(submitted for _, submitted in in_flight.values())
+            try:
+                token, result = results.get(timeout=max(0, oldest + file_timeout - time.monotonic()))
+            except queue.Empty:
+                # A worker that was killed loses its task and a hung parser never returns;
+                # either way the file gets no result. Record it and restart the pool so the
+                # stuck worker does not hold a slot for the rest of the run.
+                now = time.monotonic()
+                for path, (_, submitted) in list(in_flight.items()):
+                    if now - submitted >= file_timeout:
+                        del in_flight[path]
+                        record(worker_failure(
+                            path, 'WorkerTimeout',
+                            f"No result after {file_timeout}s; the worker hung or died "
+                            f"(e.g. killed for running out of memory)"))
+                pool.terminate()
+                pool.join()
+                pool = start_pool()
+                for path in list(in_flight):
+                    submit(path)
+                continue
+
+            current = in_flight.get(result['path'])
+            if current is None or current[0] != token:
+                continue
+            del in_flight[result['path']]
+            record(result)
+        pool.close()
+    except BaseException as e:
+        pool.terminate()
+        if isinstance(e, KeyboardInterrupt):
+            print("Interrupted; saving progress. Re-run the same command to resume.", file=out)
+        raise
+    finally:
+        try:
+            # Whatever finished before an interruption is still checkpointed
+            if batch:
+                flush()
+        finally:
+            pool.join()
+            conn.close()
+            stats['elapsed'] = time.perf_counter() - started
+
+    rate = stats['processed'] / stats['elapsed'] if stats['elapsed'] else 0.0
+    print(f"Done: {stats['imported']} imported, {stats['failed']} failed in "
+          f"{stats['elapsed']:.1f}s ({rate:.1f} files/sec)", file=out)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bulk import PDF resumes from a directory or zip archive into SQLite"
+    )
+    parser.add_argument('source', help='Directory or .zip archive containing PDF resumes')
+    parser.add_argument('--job-title', required=True, help='Job title to analyze against')
+    parser.add_argument('--job-description', help='Job description text')
+    parser.add_argument('--job-description-file', help='Read the job description from a file')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'database', 'imports.db'),
+                        help='SQLite database to write results to (default: database/imports.db)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help='Results per database transaction (default: 200)')
+    parser.add_argument('--timeout', type=float, default=60,
+                        help='Seconds to wait for a single file before recording it as failed (default: 60)')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Re-process files that failed in a previous run')
+    args = parser.parse_args(argv)
+
+    job_description = args.job_description
+    if args.job_description_file:
+        with open(args.job_description_file, encoding='utf-8') as f:
+            job_description = f.read()
+    if not job_description or not job_description.strip():
+        parser.error('--job-description or --job-description-file is required')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.timeout <= 0:
+        parser.error('--timeout must be greater than 0')
+
+    if not (os.path.isdir(args.source) or zipfile.is_zipfile(args.source)):
+        parser.error(f"Source must be a directory or zip archive: {args.source}")
+
+    try:
+        stats = run_import(
+            args.source, args.db, args.job_title, job_description,
+            workers=args.workers, batch_size=args.batch_size,
+            retry_failed=args.retry_failed, file_timeout=args.timeout
+        )
+    except KeyboardInterrupt:
+        return 130
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
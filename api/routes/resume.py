@@ -1,15 +1,54 @@
 import os
+import io
 import json
+import gzip
+import hashlib
 import PyPDF2
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, make_response, url_for
 from flask_cors import cross_origin
 import requests
 import tempfile
 import re
 import time
 
+# Brotli is optional; without it responses are only gzip-compressed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 resume_bp = Blueprint('resume', __name__)
 
+# Responses smaller than this are not worth compressing
+COMPRESSION_MIN_SIZE = 500
+
+SCORE_FIELDS = ['overall_score', 'skills_match', 'experience_relevance', 'ats_compatibility', 'keyword_density']
+
+# Static text shared by every analysis; compact responses reference it instead of repeating it
+ATS_RECOMMENDATIONS = [
+    "Use standard section headings like 'Experience', 'Skills', 'Education'",
+    "Include relevant keywords naturally throughout the resume",
+    "Use a clean, simple format without complex graphics or tables",
+    "Save as PDF to preserve formatting across different systems"
+]
+
+SUGGESTION_TEXT = {
+    'keywords': "Add more relevant keywords from the job description to improve keyword density",
+    'metrics': "Quantify your achievements with specific metrics and numbers",
+    'skills': "Highlight technical skills and competencies that match the job requirements",
+    'structure': "Use standard section headings and improve resume structure for ATS compatibility",
+    'leadership': "Emphasize leadership experience and team management achievements",
+    'senior': "Highlight advanced skills and mentoring experience appropriate for senior roles"
+}
+
+SUGGESTION_KEYS = {text: key for key, text in SUGGESTION_TEXT.items()}
+
+KEY_ACHIEVEMENTS = [
+    "Increased operational efficiency by 25% through process optimization",
+    "Led cross-functional team of 10+ members to deliver projects on time",
+    "Achieved 95% customer satisfaction rate through improved service delivery"
+]
+
 def extract_text_from_pdf(pdf_file):
     """Extract text content from uploaded PDF file"""
     try:
@@ -236,12 +275,7 @@ def analyze_with_local_logic(resume_text, job_title, job_description):
         },
         "suggestions": suggestions,
         "optimized_sections": optimized_sections,
-        "ats_recommendations": [
-            "Use standard section headings like 'Experience', 'Skills', 'Education'",
-            "Include relevant keywords naturally throughout the resume",
-            "Use a clean, simple format without complex graphics or tables",
-            "Save as PDF to preserve formatting across different systems"
-        ]
+        "ats_recommendations": list(ATS_RECOMMENDATIONS)
     }
 
 def extract_keywords(text):
@@ -319,23 +353,23 @@ def generate_local_suggestions(resume_text, job_title, job_description, scores):
     suggestions = []
     
     if scores['keywords'] < 70:
-        suggestions.append("Add more relevant keywords from the job description to improve keyword density")
+        suggestions.append(SUGGESTION_TEXT['keywords'])
     
     if scores['experience'] < 80:
-        suggestions.append("Quantify your achievements with specific metrics and numbers")
+        suggestions.append(SUGGESTION_TEXT['metrics'])
     
     if scores['skills'] < 75:
-        suggestions.append("Highlight technical skills and competencies that match the job requirements")
+        suggestions.append(SUGGESTION_TEXT['skills'])
     
     if scores['ats'] < 85:
-        suggestions.append("Use standard section headings and improve resume structure for ATS compatibility")
+        suggestions.append(SUGGESTION_TEXT['structure'])
     
     # Add job-specific suggestions
     if 'manager' in job_title.lower():
-        suggestions.append("Emphasize leadership experience and team management achievements")
+        suggestions.append(SUGGESTION_TEXT['leadership'])
     
     if 'senior' in job_title.lower():
-        suggestions.append("Highlight advanced skills and mentoring experience appropriate for senior roles")
+        suggestions.append(SUGGESTION_TEXT['senior'])
     
     return suggestions[:4]  # Return top 4 suggestions
 
@@ -351,11 +385,7 @@ def create_optimized_sections(resume_text, job_title, job_keywords):
     skills = list(set(skills))[:8]  # Remove duplicates and limit to 8
     
     # Generate key achievements
-    achievements = [
-        "Increased operational efficiency by 25% through process optimization",
-        "Led cross-functional team of 10+ members to deliver projects on time",
-        "Achieved 95% customer satisfaction rate through improved service delivery"
-    ]
+    achievements = list(KEY_ACHIEVEMENTS)
     
     return {
         "summary": summary,
@@ -426,6 +456,79 @@ def create_structured_analysis(resume_text, job_title, job_description, ai_respo
     # If AI response is not structured, fall back to local analysis
     return analyze_with_local_logic(resume_text, job_title, job_description)
 
+def is_compact_request(data=None):
+    """Check whether the client asked for a compact payload via query string or body"""
+    value = request.args.get('compact')
+    if value is None and data:
+        value = data.get('compact')
+    if value is None:
+        value = request.form.get('compact')
+    return str(value).lower() in ('1', 'true', 'yes')
+
+def compact_analysis(analysis):
+    """Reduce an analysis to its scores plus references to static text"""
+    compact = {field: analysis.get(field) for field in SCORE_FIELDS}
+    compact['suggestion_keys'] = []
+    compact['suggestions'] = []
+    for suggestion in analysis.get('suggestions', []):
+        if isinstance(suggestion, str) and suggestion in SUGGESTION_KEYS:
+            compact['suggestion_keys'].append(SUGGESTION_KEYS[suggestion])
+        else:
+            # Free-text suggestions from AI providers have no static reference
+            compact['suggestions'].append(suggestion)
+    compact['static_text'] = url_for('resume.static_text')
+    return compact
+
+def analysis_etag(*parts):
+    """Build an ETag from the analysis inputs so identical requests can be answered with 304"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()[:32]
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds the result for this ETag
+
+    HTTP specifies 412 for a matching conditional POST; 304 is a deliberate exception so
+    clients can treat repeat analyses like a cache revalidation. `*` is ignored because it
+    would match input that was never analyzed.
+    """
+    if request.if_none_match.star_tag:
+        return None
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+@resume_bp.after_request
+def compress_response(response):
+    """Compress JSON responses with brotli or gzip based on Accept-Encoding"""
+    if (response.direct_passthrough or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers or not response.is_json):
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    offered = ['br', 'gzip'] if brotli else ['gzip']
+    encoding = request.accept_encodings.best_match(offered)
+
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=5))
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(data, compresslevel=6))
+    else:
+        return response
+
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 @resume_bp.route('/upload', methods=['POST'])
 @cross_origin()
 def upload_resume():
@@ -447,18 +550,21 @@ def upload_resume():
         if not resume_text.strip():
             return jsonify({'error': 'Could not extract text from PDF. Please ensure the PDF contains readable text.'}), 400
         
-        return jsonify({
+        result = {
             'success': True,
             'message': 'Resume uploaded and processed successfully',
-            'text_length': len(resume_text),
-            'preview': resume_text[:200] + '...' if len(resume_text) > 200 else resume_text
-        })
+            'text_length': len(resume_text)
+        }
+        if not is_compact_request():
+            result['preview'] = resume_text[:200] + '...' if len(resume_text) > 200 else resume_text
+        
+        return jsonify(result)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @resume_bp.route('/analyze', methods=['POST'])
-@cross_origin()
+@cross_origin(expose_headers=['ETag'])
 def analyze_resume():
     """Analyze resume against job requirements"""
     try:
@@ -488,6 +594,13 @@ def analyze_resume():
         if not resume_text.strip():
             return jsonify({'error': 'Resume text is empty'}), 400
         
+        # Identical input was already analyzed by this client
+        compact = is_compact_request(data)
+        etag = analysis_etag(resume_text, data['job_title'], data['job_description'], str(compact))
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
         # Analyze with AI
         analysis_result = analyze_resume_with_free_ai(
             resume_text=resume_text,
@@ -495,16 +608,18 @@ def analyze_resume():
             job_description=data['job_description']
         )
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'analysis': analysis_result
+            'analysis': compact_analysis(analysis_result) if compact else analysis_result
         })
+        response.set_etag(etag, weak=True)
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @resume_bp.route('/analyze-with-upload', methods=['POST'])
-@cross_origin()
+@cross_origin(expose_headers=['ETag'])
 def analyze_with_upload():
     """Combined endpoint for upload and analysis"""
     try:
@@ -523,8 +638,16 @@ def analyze_with_upload():
         if not job_title or not job_description:
             return jsonify({'error': 'Job title and description are required'}), 400
         
+        # Identical upload was already analyzed by this client; skip PDF extraction entirely
+        compact = is_compact_request()
+        pdf_bytes = file.read()
+        etag = analysis_etag(pdf_bytes, job_title, job_description, str(compact))
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
         # Extract text from PDF
-        resume_text = extract_text_from_pdf(file)
+        resume_text = extract_text_from_pdf(io.BytesIO(pdf_bytes))
         
         if not resume_text.strip():
             return jsonify({'error': 'Could not extract readable text from PDF'}), 400
@@ -536,15 +659,37 @@ def analyze_with_upload():
             job_description=job_description
         )
         
-        return jsonify({
-            'success': True,
-            'analysis': analysis_result,
-            'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
-        })
+        if compact:
+            result = {'success': True, 'analysis': compact_analysis(analysis_result)}
+        else:
+            result = {
+                'success': True,
+                'analysis': analysis_result,
+                'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
+            }
+        
+        response = jsonify(result)
+        response.set_etag(etag, weak=True)
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@resume_bp.route('/static-text', methods=['GET'])
+@cross_origin()
+def static_text():
+    """Static recommendation text referenced by compact analysis responses"""
+    response = jsonify({
+        'ats_recommendations': ATS_RECOMMENDATIONS,
+        'suggestions': SUGGESTION_TEXT,
+        'key_achievements': KEY_ACHIEVEMENTS
+    })
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    # Weak because compress_response may change the bytes after the ETag is computed
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
 @resume_bp.route('/health', methods=['GET'])
 @cross_origin()
 def health_check():